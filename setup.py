@@ -44,6 +44,7 @@ def main():
                      packages=['MongoDBLibrary'],
                      include_package_data=True,
                      install_requires=requirements,
+                     extras_require={'orjson': ['orjson']},
                      zip_safe=False,
                      classifiers=CLASSIFIERS.splitlines(),
                      test_suite='tests',
@@ -12,6 +12,8 @@ class MongoConnectionManager(object):
         Initializes _dbconnection to None.
         """
         self._dbconnection = None
+        self._coll_cache = {}
+        self._write_buffers = {}
         self._builtin = BuiltIn()
 
     def connect_to_mongodb(self, dbHost='localhost', dbPort=27017, dbMaxPoolSize=10, dbNetworkTimeout=None,
@@ -40,12 +42,14 @@ class MongoConnectionManager(object):
         logging.debug(
             "| Connect To MondoDB | dbHost | dbPort | dbMaxPoolSize | dbNetworktimeout | dbDocClass | dbTZAware |")
         logging.debug(
-            "| Connect To MondoDB | %s | %s | %s | %s | %s | %s |" % (dbHost, dbPort, dbMaxPoolSize, dbNetworkTimeout,
-                                                                      dbDocClass, dbTZAware))
+            "| Connect To MondoDB | %s | %s | %s | %s | %s | %s |", dbHost, dbPort, dbMaxPoolSize, dbNetworkTimeout,
+            dbDocClass, dbTZAware)
 
         self._dbconnection = db_api_2.MongoClient(host=dbHost, port=dbPort, socketTimeoutMS=dbNetworkTimeout,
                                                   document_class=dbDocClass, tz_aware=dbTZAware,
                                                   maxPoolSize=dbMaxPoolSize)
+        self._coll_cache = {}
+        self._write_buffers = {}
 
     def disconnect_from_mongodb(self):
         """
@@ -56,3 +60,4 @@ class MongoConnectionManager(object):
         """
         logging.debug("| Disconnect From MongoDB |")
         self._dbconnection.close()
+        self._coll_cache = {}
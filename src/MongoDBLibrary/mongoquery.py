@@ -1,15 +1,64 @@
 import ast
+import copy
+import functools
 import json
 import re
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import DeleteMany, InsertOne, ReturnDocument, UpdateMany
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson reads integers of 2**64 or more as floats, so text that may hold
+# one (20 digits in a row) is left to the json module
+_BIG_INT_RE = re.compile(r'\d{20}')
+
+
+def _loads(text):
+    # orjson is stricter than the json module, e.g. it rejects NaN and
+    # Infinity, so anything it refuses is handed to json.loads as before.
+    if orjson is not None and not _BIG_INT_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# JSON literals which ast.literal_eval does not understand, mapped to Python
+_LITERAL_RE = re.compile(r'\b(?:false|true|null)\b', re.IGNORECASE)
+_LITERAL_MAP = {'false': 'False', 'true': 'True', 'null': 'None'}
+
+# Python-style query strings already parsed by literal_eval, oldest first
+_LITERAL_EVAL_CACHE = {}
+_LITERAL_EVAL_CACHE_SIZE = 256
+
+# Documents fetched per cursor round trip when retrieving records
+_FIND_BATCH_SIZE = 1000
+
+# Keys each operation of Bulk Modify MongoDB Records must have
+_BULK_OPERATION_KEYS = {
+    'update': ('filter', 'update'),
+    'remove': ('filter',),
+    'insert': ('document',),
+}
+
+# Robot Framework passes booleans as strings, these ones mean False
+_FALSY = frozenset(('false', '0', 'no', 'off', 'none', ''))
+
+
 class MongoQuery(object):
     """
     Query handles all the querying done by the MongoDB Library. 
     """
-    def pythonish_to_json_dict(self, text: str):
+    @staticmethod
+    def pythonish_to_json_dict(text: str):
         """
         Parses a hybrid JSON/Python-style dict string into a valid Python dict.
         Supports:
@@ -18,19 +67,29 @@ class MongoQuery(object):
         - JSON literals like false/null/true
         """
 
-        # Normalize JSON literals to Python ones for ast.literal_eval
-        fixed = text
-        fixed = re.sub(r'\bfalse\b', 'False', fixed, flags=re.IGNORECASE)
-        fixed = re.sub(r'\btrue\b', 'True', fixed, flags=re.IGNORECASE)
-        fixed = re.sub(r'\bnull\b', 'None', fixed, flags=re.IGNORECASE)
+        # Strings already known to need literal_eval skip the failing JSON
+        # parse. The copy keeps _id handling from changing the cached value.
+        cached = _LITERAL_EVAL_CACHE.get(text, _LITERAL_EVAL_CACHE)
+        if cached is not _LITERAL_EVAL_CACHE:
+            return copy.copy(cached)
+
+        # Strict JSON is the common case and needs no normalization
+        try:
+            return _loads(text)
+        except json.JSONDecodeError:  # orjson's error subclasses this one
+            pass
 
+        # Normalize JSON literals to Python ones for ast.literal_eval. The
+        # result is handed to PyMongo as is; BSON encodes tuples as arrays too.
+        fixed = _LITERAL_RE.sub(lambda m: _LITERAL_MAP[m.group(0).lower()], text)
         try:
-            # Try parsing with Python's safe literal parser
             obj = ast.literal_eval(fixed)
-            # Convert back to JSON-safe dict (ensures proper types)
-            return json.loads(json.dumps(obj))
         except Exception as e:
             raise Exception(f"Error parsing pythonish to json dict: {e}")
+        if len(_LITERAL_EVAL_CACHE) >= _LITERAL_EVAL_CACHE_SIZE:
+            del _LITERAL_EVAL_CACHE[next(iter(_LITERAL_EVAL_CACHE))]
+        _LITERAL_EVAL_CACHE[text] = obj
+        return copy.copy(obj)
 
     def get_mongodb_databases(self):
         """
@@ -42,7 +101,7 @@ class MongoQuery(object):
         | Log Many | @{allDBs} |
         | Should Contain | ${allDBs} | DBName |
         """
-        allDBs = self._dbconnection.database_names()
+        allDBs = self._dbconnection.list_database_names()
         logging.debug("| @{allDBs} | Get Mongodb Databases |")
         return allDBs
 
@@ -57,12 +116,9 @@ class MongoQuery(object):
         | Should Contain | ${allCollections} | CollName |
         """
         dbName = str(dbName)
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        allCollections = db.collection_names()
-        logging.debug("| @{allCollections} | Get MongoDB Collections | %s |" % dbName)
+        db = self._db(dbName)
+        allCollections = db.list_collection_names()
+        logging.debug("| @{allCollections} | Get MongoDB Collections | %s |", dbName)
         return allCollections
 
     def drop_mongodb_database(self, dbDelName):
@@ -76,11 +132,11 @@ class MongoQuery(object):
         | Should Not Contain | ${allDBs} | myDB |
         """
         dbDelName = str(dbDelName)
-        logging.debug("| Drop MongoDB Database | %s |" % dbDelName)
-        try:
-            self._dbconnection.drop_database('%s' % dbDelName)
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
+        logging.debug("| Drop MongoDB Database | %s |", dbDelName)
+        self._require_connection()
+        self._dbconnection.drop_database(dbDelName)
+        for key in [key for key in self._coll_cache if key[0] == dbDelName]:
+            del self._coll_cache[key]
 
     def drop_mongodb_collection(self, dbName, dbCollName):
         """
@@ -93,12 +149,11 @@ class MongoQuery(object):
         | Should Not Contain | ${allCollections} | CollectionName |
         """
         dbName = str(dbName)
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        db.drop_collection('%s' % dbCollName)
-        logging.debug("| Drop MongoDB Collection | %s | %s |" % (dbName, dbCollName))
+        dbCollName = str(dbCollName)
+        db = self._db(dbName)
+        db.drop_collection(dbCollName)
+        self._coll_cache.pop((dbName, dbCollName), None)
+        logging.debug("| Drop MongoDB Collection | %s | %s |", dbName, dbCollName)
 
     def validate_mongodb_collection(self, dbName, dbCollName):
         """
@@ -111,34 +166,33 @@ class MongoQuery(object):
         """
         dbName = str(dbName)
         dbCollName = str(dbCollName)
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        allResults = db.validate_collection('%s' % dbCollName)
-        logging.debug("| ${allResults} | Validate MongoDB Collection | %s | %s |" % (dbName, dbCollName))
+        db = self._db(dbName)
+        allResults = db.validate_collection(dbCollName)
+        logging.debug("| ${allResults} | Validate MongoDB Collection | %s | %s |", dbName, dbCollName)
         return allResults
 
     def get_mongodb_collection_count(self, dbName, dbCollName):
         """
         Returns the number records for the collection specified.
 
+        The count comes from the collection metadata, so it does not scan the
+        collection. After an unclean shutdown, or on sharded clusters with
+        orphaned documents, it may differ from the real number of documents;
+        use ``Get MongoDB Collection Count With Condition`` with ``{}`` for an
+        exact count.
+
         Usage is:
         | ${allResults} | Get MongoDB Collection Count | DBName | CollectionName |
         | Log | ${allResults} |
         """
         dbName = str(dbName)
         dbCollName = str(dbCollName)
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbCollName]
-        count = coll.count_documents({})
-        logging.debug("| ${allResults} | Get MongoDB Collection Count | %s | %s |" % (dbName, dbCollName))
+        coll = self._get_coll(dbName, dbCollName)
+        count = coll.estimated_document_count()
+        logging.debug("| ${allResults} | Get MongoDB Collection Count | %s | %s |", dbName, dbCollName)
         return count
 
-    def insert_mongodb_record(self, dbName, dbCollName, recordJSON):
+    def insert_mongodb_record(self, dbName, dbCollName, recordJSON, write_concern='default'):
         """ 
         The pymongo's insert_one() operation is performed. 
 
@@ -147,28 +201,111 @@ class MongoQuery(object):
         Enter a new record usage is:
         | ${inserted_id} | Insert MongoDB Record | foo | bar | {"timestamp":1, "msg":"Hello 1"} |
         | Log | ${inserted_id} |
+
+        ``write_concern`` sets how many servers must acknowledge the write, see
+        ``Insert MongoDB Records``.
         """
         dbName = str(dbName)
         dbCollName = str(dbCollName)
-        recordJSON = dict(json.loads(recordJSON))
-        if '_id' in recordJSON:
-            recordJSON['_id'] = ObjectId(recordJSON['_id'])
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbCollName]
+        recordJSON = _loads(recordJSON)
+        self._coerce_object_id(recordJSON)
+        coll = _with_write_concern(self._get_coll(dbName, dbCollName), write_concern)
         inserted = coll.insert_one(recordJSON)
-        logging.debug("| ${inserted.inserted_id} | Insert MongoDB Records | %s | %s | %s |" % (dbName, dbCollName, recordJSON))
+        logging.debug("| ${inserted.inserted_id} | Insert MongoDB Records | %s | %s | %s |", dbName, dbCollName, recordJSON)
         return inserted.inserted_id
 
+    def insert_mongodb_records(self, dbName, dbCollName, recordsJSON, buffered=False, bufferSize=1000,
+                               write_concern='default'):
+        """
+        The pymongo's insert_many() operation is performed with all of the
+        records in the JSON array, in a single round trip to the server.
+        Returns the list of inserted ids.
+
+        When ``buffered`` is True the records are only queued for the collection
+        and written once ``bufferSize`` records are pending, or when
+        ``Flush MongoDB Writes`` is called. Buffered records that are never
+        flushed are not written, so flush before disconnecting; connecting
+        again discards them. When the server rejects some of the buffered
+        records the others are still written and the buffer is emptied, the
+        error lists the rejected ones. When the write fails for other reasons,
+        such as a lost connection, the records stay queued for the next flush.
+
+        ``write_concern`` is the ``w`` value the write is acknowledged with:
+        ``default`` keeps the connection's setting, a number of servers such
+        as ``1``, or ``majority``. ``0`` does not wait for any acknowledgement
+        at all, which is much faster for setting up test data but means
+        failed writes go unnoticed and the written records may not be visible
+        to an immediately following query. Buffered records are queued
+        separately per write concern and are always written with the one
+        they were queued with.
+
+        | ${allResults} | Insert MongoDB Records | DBName | CollectionName | JSON array |
+
+        Enter new records usage is:
+        | ${inserted_ids} | Insert MongoDB Records | foo | bar | [{"timestamp":1, "msg":"Hello 1"}, {"timestamp":2, "msg":"Hello 2"}] |
+        | Log Many | @{inserted_ids} |
+
+        Buffered usage is:
+        | FOR | ${i} | IN RANGE | 100 |
+        |     | Insert MongoDB Records | foo | bar | [{"timestamp":${i}}] | buffered=True |
+        | END |
+        | Flush MongoDB Writes |
+
+        Unacknowledged usage is:
+        | Insert MongoDB Records | foo | bar | [{"timestamp":1}, {"timestamp":2}] | write_concern=0 |
+        """
+        dbName = str(dbName)
+        dbCollName = str(dbCollName)
+        records = _loads(recordsJSON)
+        if not isinstance(records, list):
+            raise Exception('Not a JSON array of records: %s' % recordsJSON)
+        for record in records:
+            if not isinstance(record, dict):
+                raise Exception('Not a valid record: %s' % (record,))
+            self._coerce_object_id(record)
+        logging.debug("| ${allResults} | Insert MongoDB Records | %s | %s | %s |", dbName, dbCollName, recordsJSON)
+        if buffered:
+            key = (dbName, dbCollName, str(write_concern))
+            buffer = self._write_buffers.setdefault(key, [])
+            buffer.extend(records)
+            if len(buffer) < int(bufferSize):
+                return []
+            return self._write_buffer(key)
+        if not records:
+            return []
+        coll = _with_write_concern(self._get_coll(dbName, dbCollName), write_concern)
+        inserted = coll.insert_many(records, ordered=False)
+        return inserted.inserted_ids
+
+    def flush_mongodb_writes(self):
+        """
+        Writes all of the records queued by ``Insert MongoDB Records`` in
+        buffered mode and returns the number of records inserted. Each
+        buffer is written with the write concern its records were queued with.
+
+        Usage is:
+        | ${count} | Flush MongoDB Writes |
+        | Log | ${count} |
+        """
+        count = 0
+        errors = []
+        for key in list(self._write_buffers):
+            try:
+                count += len(self._write_buffer(key))
+            except Exception as e:
+                errors.append('%s.%s: %s' % (key[0], key[1], e))
+        logging.debug("| ${count} | Flush MongoDB Writes |")
+        if errors:
+            raise Exception('Flush MongoDB Writes failed for %s' % '; '.join(errors))
+        return count
+
     def save_mongodb_records(self, dbName, dbCollName, recordJSON):
         """
-        If to_save already has an "_id" then an update() (upsert) operation is 
-        performed and any existing document with that "_id" is overwritten. 
-        Otherwise an insert() operation is performed. In this case if manipulate 
-        is True an "_id" will be added to to_save and this method returns the 
-        "_id" of the saved document.
+        If the record already has an "_id" then a replace_one() (upsert) operation
+        is performed and any existing document with that "_id" is overwritten.
+        Otherwise an insert_one() operation is performed and an "_id" is
+        generated. In both cases this method returns the "_id" of the saved
+        document.
 
         | ${allResults} | Save MongoDB Records | DBName | CollectionName | JSON |
 
@@ -182,16 +319,15 @@ class MongoQuery(object):
         """
         dbName = str(dbName)
         dbCollName = str(dbCollName)
-        recordJSON = dict(json.loads(recordJSON))
+        recordJSON = _loads(recordJSON)
+        self._coerce_object_id(recordJSON)
+        coll = self._get_coll(dbName, dbCollName)
         if '_id' in recordJSON:
-            recordJSON['_id'] = ObjectId(recordJSON['_id'])
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbCollName]
-        allResults = coll.save(recordJSON)
-        logging.debug("| ${allResults} | Save MongoDB Records | %s | %s | %s |" % (dbName, dbCollName, recordJSON))
+            coll.replace_one({'_id': recordJSON['_id']}, recordJSON, upsert=True)
+            allResults = recordJSON['_id']
+        else:
+            allResults = coll.insert_one(recordJSON).inserted_id
+        logging.debug("| ${allResults} | Save MongoDB Records | %s | %s | %s |", dbName, dbCollName, recordJSON)
         return allResults
 
     def update_many_mongodb_records(self, dbName, dbCollName, queryJSON, updateJSON, upsert=False):
@@ -207,33 +343,36 @@ class MongoQuery(object):
         """
         db_name = str(dbName)
         collection_name = str(dbCollName)
-        query_json = json.loads(queryJSON)
-        update_json = json.loads(updateJSON)
-        if '_id' in query_json:
-            query_json['_id'] = ObjectId(queryJSON['_id'])
-        try:
-            db = self._dbconnection['%s' % (db_name,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % collection_name]
+        query_json = _loads(queryJSON)
+        update_json = _loads(updateJSON)
+        self._coerce_object_id(query_json)
+        coll = self._get_coll(db_name, collection_name)
         allResults = coll.update_many(query_json, update_json, upsert=upsert)
-        logging.debug("Matched: %i documents" % allResults.matched_count)
-        logging.debug("| ${allResults} | Update Many MongoDB Records | %s | %s | %s | %s |" % (
-            dbName, dbCollName, query_json, update_json))
+        logging.debug("Matched: %i documents", allResults.matched_count)
+        logging.debug("| ${allResults} | Update Many MongoDB Records | %s | %s | %s | %s |",
+                      dbName, dbCollName, query_json, update_json)
         return allResults.modified_count
 
-    def retrieve_all_mongodb_records(self, dbName, dbCollName, returnDocuments=False):
+    def retrieve_all_mongodb_records(self, dbName, dbCollName, returnDocuments=False, stream=False):
         """
         Retrieve ALL of the records in a give MongoDB database collection.
         Returned value must be single quoted for comparison, otherwise you will
         get a TypeError error.
 
+        With ``returnDocuments`` the documents are returned as a list. When
+        ``stream`` is also True the PyMongo cursor is returned instead, so the
+        documents are fetched lazily while it is iterated. Lists are what
+        Robot keywords usually want; the cursor is meant for processing large
+        collections from Python keywords. ``stream`` without ``returnDocuments``
+        fails, as the string result cannot be streamed.
+
         Usage is:
         | ${allResults} | Retrieve All MongoDB Records | DBName | CollectionName |
         | Log | ${allResults} |
         | Should Contain X Times | ${allResults} | '${recordNo1}' | 1 |
         """
-        return self._retrieve_mongodb_records(dbName, dbCollName, '{}', returnDocuments=returnDocuments)
+        return self._retrieve_mongodb_records(dbName, dbCollName, '{}', returnDocuments=returnDocuments,
+                                              stream=stream)
 
     def retrieve_some_mongodb_records(self, dbName, dbCollName, recordJSON, returnDocuments=False):
         """
@@ -247,7 +386,7 @@ class MongoQuery(object):
         | Log | ${allResults} |
         | Should Contain X Times | ${allResults} | '${recordNo1}' | 1 |
         """
-        logging.debug("| ${allResults} | Retrieve Some MongoDB Records | %s | %s | %s |" % (dbName, dbCollName, recordJSON))
+        logging.debug("| ${allResults} | Retrieve Some MongoDB Records | %s | %s | %s |", dbName, dbCollName, recordJSON)
         return self._retrieve_mongodb_records(dbName, dbCollName, recordJSON, returnDocuments=returnDocuments)
 
     def retrieve_and_update_one_mongodb_record(self, dbName, dbCollName, queryJSON, updateJSON,
@@ -265,23 +404,18 @@ class MongoQuery(object):
         """
         dbname = str(dbName)
         dbcollname = str(dbCollName)
-        record_json = dict(json.loads(queryJSON))
-        update_json = dict(json.loads(updateJSON))
+        record_json = _loads(queryJSON)
+        update_json = _loads(updateJSON)
         document_to_return = ReturnDocument.BEFORE if returnBeforeDocument is True else ReturnDocument.AFTER
-        if '_id' in record_json:
-            record_json['_id'] = ObjectId(record_json['_id'])
-        try:
-            db = self._dbconnection['%s' % (dbname,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbcollname]
+        self._coerce_object_id(record_json)
+        coll = self._get_coll(dbname, dbcollname)
         all_results = coll.find_one_and_update(record_json, update_json, return_document=document_to_return)
-        logging.debug("| ${allResults} | Retrieve And Update One Mongodb Record | %s | %s | %s | %s | %s" % (
-            dbname,
-            dbcollname,
-            queryJSON,
-            updateJSON,
-            returnBeforeDocument))
+        logging.debug("| ${allResults} | Retrieve And Update One Mongodb Record | %s | %s | %s | %s | %s",
+                      dbname,
+                      dbcollname,
+                      queryJSON,
+                      updateJSON,
+                      returnBeforeDocument)
         return all_results
 
     def retrieve_mongodb_records_with_desired_fields(self, dbName, dbCollName, recordJSON, fields, return__id=True,
@@ -303,7 +437,8 @@ class MongoQuery(object):
         usage examples for more details how to use fields argument.
 
         return__id controls is the _id field also returned with the projections.
-        Possible values are True and False
+        Possible values are True and False. The strings false, 0, no, off, none
+        and an empty string (in any case) mean False, any other value means True.
 
         The following usages assume a database name account, collection named users and
         that contain documents of the following prototype:
@@ -324,63 +459,68 @@ class MongoQuery(object):
 
         """
         # Convert return__id to boolean value because Robot Framework returns False/True as Unicode
-        try:
-            if return__id.isdigit():
-                pass
-            else:
-                return__id = return__id.lower()
-                if return__id == 'false':
-                    return__id = False
-                else:
-                    return__id = True
-        except AttributeError:
-            pass
+        return__id = _to_bool(return__id)
 
         # Convert the fields string as a dictionary and handle _id field
-        if fields:
-            data = {}
-            fields = fields.replace(' ', '')
-            for item in fields.split(','):
-                data[item] = True
-
-            if return__id:
-                data['_id'] = True
-            elif not return__id:
-                data['_id'] = False
-            else:
-                raise Exception('Not a boolean value for return__id: %s' % return__id)
-        else:
-            data = []
+        data = dict(_build_projection(fields, return__id)) if fields else None
 
-        logging.debug("| ${allResults} | retreive_mongodb_records_with_desired_fields | %s | %s | %s | %s | %s |" % (
-            dbName, dbCollName, recordJSON, fields, return__id))
+        logging.debug("| ${allResults} | retreive_mongodb_records_with_desired_fields | %s | %s | %s | %s | %s |",
+                      dbName, dbCollName, recordJSON, fields, return__id)
         return self._retrieve_mongodb_records(dbName, dbCollName, recordJSON, data, returnDocuments)
 
-    def _retrieve_mongodb_records(self, dbName, dbCollName, recordJSON, fields=[], returnDocuments=False):
-        dbName = str(dbName)
-        dbCollName = str(dbCollName)
-        criteria = self.pythonish_to_json_dict(recordJSON)
-
+    @staticmethod
+    def _coerce_object_id(document):
         # handle _id column (ObjectId)
-        if '_id' in criteria:
-            criteria['_id'] = ObjectId(criteria['_id'])
+        oid = document.get('_id')
+        if oid is not None and not isinstance(oid, ObjectId):
+            document['_id'] = ObjectId(oid)
 
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
+    def _require_connection(self):
+        if self._dbconnection is None:
             self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbCollName]
-        if fields:
-            results = coll.find(criteria, fields)
-        else:
-            results = coll.find(criteria)
+
+    def _db(self, dbName):
+        self._require_connection()
+        return self._dbconnection[dbName]
+
+    def _write_buffer(self, key):
+        dbName, dbCollName, write_concern = key
+        coll = _with_write_concern(self._get_coll(dbName, dbCollName), write_concern)
+        try:
+            inserted = coll.insert_many(self._write_buffers[key], ordered=False)
+        except BulkWriteError:
+            # The server answered for every record, the rest were written and
+            # the rejected ones would only be rejected again on a retry
+            del self._write_buffers[key]
+            raise
+        del self._write_buffers[key]
+        return inserted.inserted_ids
+
+    def _get_coll(self, dbName, dbCollName):
+        # Collection handles are cached per connection to save PyMongo the
+        # name validation and object construction on every keyword call.
+        key = (dbName, dbCollName)
+        try:
+            return self._coll_cache[key]
+        except KeyError:
+            pass
+        coll = self._coll_cache[key] = self._db(dbName)[dbCollName]
+        return coll
+
+    def _retrieve_mongodb_records(self, dbName, dbCollName, recordJSON, fields=[], returnDocuments=False,
+                                  stream=False):
+        if stream and not returnDocuments:
+            raise Exception('stream=True needs returnDocuments=True, the string result cannot be streamed')
+        dbName = str(dbName)
+        dbCollName = str(dbCollName)
+        criteria = self.pythonish_to_json_dict(recordJSON)
+        self._coerce_object_id(criteria)
+        coll = self._get_coll(dbName, dbCollName)
+        results = coll.find(criteria, fields or None, batch_size=_FIND_BATCH_SIZE)
         if returnDocuments:
-            return list(results)
+            return results if stream else list(results)
         else:
-            response = ''
-            for d in results:
-                response = '%s%s' % (response, d.items())
-            return response
+            return ''.join(str(d.items()) for d in results)
 
     def remove_mongodb_records(self, dbName, dbCollName, recordJSON):
         """
@@ -403,40 +543,93 @@ class MongoQuery(object):
         """
         dbName = str(dbName)
         dbCollName = str(dbCollName)
-        recordJSON = json.loads(recordJSON)
-        if '_id' in recordJSON:
-            recordJSON['_id'] = ObjectId(recordJSON['_id'])
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbCollName]
+        recordJSON = _loads(recordJSON)
+        self._coerce_object_id(recordJSON)
+        coll = self._get_coll(dbName, dbCollName)
         allResults = coll.delete_many(recordJSON)
-        logging.debug("| ${allResults} | Remove MongoDB Records | %s | %s | %s |" % (dbName, dbCollName, recordJSON))
+        logging.debug("| ${allResults} | Remove MongoDB Records | %s | %s | %s |", dbName, dbCollName, recordJSON)
         return allResults
     
-    def aggregate_mongodb_records(self, dbName, dbCollName, aggregate_cond=None):
+    def bulk_modify_mongodb_records(self, dbName, dbCollName, operationsJSON, write_concern='default'):
+        """
+        Performs a list of update, remove and insert operations on a given
+        MongoDB database collection with a single bulk_write() call, instead
+        of one round trip per ``Update Many MongoDB Records`` or
+        ``Remove MongoDB Records`` call. The operations are unordered, so one
+        failing operation does not stop the others.
+
+        operationsJSON is a JSON array of objects with an ``op`` key:
+        | update | {"op": "update", "filter": {...}, "update": {...}, "upsert": false} |
+        | remove | {"op": "remove", "filter": {...}} |
+        | insert | {"op": "insert", "document": {...}} |
+
+        Returns a dictionary with the number of matched, modified, upserted,
+        removed and inserted documents. For ``write_concern`` see
+        ``Insert MongoDB Records``; with ``0`` the server reports no counts
+        and an empty dictionary is returned.
+
+        Usage is:
+        | ${OperationsJSON} | Set Variable | [{"op": "update", "filter": {"type": "basic_user"}, "update": {"$set": {"in_use": true}}}, {"op": "remove", "filter": {"in_use": false}}] |
+        | &{allResults} | Bulk Modify MongoDB Records | DBName | CollectionName | ${OperationsJSON} |
+        | Log | ${allResults} |
+        """
+        dbName = str(dbName)
+        dbCollName = str(dbCollName)
+        requests = []
+        for operation in _loads(operationsJSON):
+            op = operation.get('op')
+            if op not in _BULK_OPERATION_KEYS:
+                raise Exception('Not a valid bulk operation: %s' % op)
+            for key in _BULK_OPERATION_KEYS[op]:
+                if key not in operation:
+                    raise Exception('Bulk %s operation is missing the "%s" key: %s' % (op, key, operation))
+            if op == 'update':
+                self._coerce_object_id(operation['filter'])
+                requests.append(UpdateMany(operation['filter'], operation['update'],
+                                           upsert=operation.get('upsert', False)))
+            elif op == 'remove':
+                self._coerce_object_id(operation['filter'])
+                requests.append(DeleteMany(operation['filter']))
+            else:
+                self._coerce_object_id(operation['document'])
+                requests.append(InsertOne(operation['document']))
+        if not requests:
+            return dict.fromkeys(('matched', 'modified', 'upserted', 'removed', 'inserted'), 0)
+        coll = _with_write_concern(self._get_coll(dbName, dbCollName), write_concern)
+        allResults = coll.bulk_write(requests, ordered=False)
+        logging.debug("| ${allResults} | Bulk Modify MongoDB Records | %s | %s | %s |",
+                      dbName, dbCollName, operationsJSON)
+        if not allResults.acknowledged:
+            return {}
+        return {
+            'matched': allResults.matched_count,
+            'modified': allResults.modified_count,
+            'upserted': allResults.upserted_count,
+            'removed': allResults.deleted_count,
+            'inserted': allResults.inserted_count,
+        }
+
+    def aggregate_mongodb_records(self, dbName, dbCollName, aggregate_cond=None, stream=False):
         """
         Returns the aggregated results based on the aggregate_cond.
 
+        The results are returned as a list. When ``stream`` is True the
+        PyMongo cursor is returned instead, so large results can be consumed
+        lazily instead of being held in memory at once.
+
         Usage is:
         | ${results} | Aggregate MongoDB Records | DBName | CollectionName | Aggregate_cond |
         """
-        agg_cond = aggregate_cond or []
-        agg_cond = json.loads(agg_cond)
+        agg_cond = self.pythonish_to_json_dict(aggregate_cond or '[]')
         dbName = str(dbName)
         dbCollName = str(dbCollName)
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbCollName]
-        logging.debug(f"Aggregate_cond: {agg_cond}")
+        coll = self._get_coll(dbName, dbCollName)
+        logging.debug("Aggregate_cond: %r", agg_cond)
         results = coll.aggregate(agg_cond)
-        logging.debug("| ${results} | Aggregate MongoDB Records | %s | %s |" % (dbName, dbCollName))
-        return list(results)
+        logging.debug("| ${results} | Aggregate MongoDB Records | %s | %s |", dbName, dbCollName)
+        return results if stream else list(results)
 
-    def get_mongodb_collection_count_with_condition(self, dbName, dbCollName, conditionJSON = {}):
+    def get_mongodb_collection_count_with_condition(self, dbName, dbCollName, conditionJSON='{}'):
         """
         Returns the number records for the collection specified.
 
@@ -446,12 +639,31 @@ class MongoQuery(object):
         """
         dbName = str(dbName)
         dbCollName = str(dbCollName)
-        criteria = dict(json.loads(conditionJSON))
-        try:
-            db = self._dbconnection['%s' % (dbName,)]
-        except TypeError:
-            self._builtin.fail("Connection failed, please make sure you have run 'Connect To Mongodb' first.")
-        coll = db['%s' % dbCollName]
+        criteria = self.pythonish_to_json_dict(conditionJSON)
+        coll = self._get_coll(dbName, dbCollName)
         count = coll.count_documents(criteria)
-        logging.debug("| ${allResults} | Get MongoDB Collection Count | %s | %s |" % (dbName, dbCollName))
+        logging.debug("| ${allResults} | Get MongoDB Collection Count | %s | %s |", dbName, dbCollName)
         return count
+
+
+@functools.lru_cache(maxsize=128)
+def _build_projection(fields, include_id):
+    projection = dict.fromkeys(fields.replace(' ', '').split(','), True)
+    projection['_id'] = include_id
+    return projection
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() not in _FALSY
+    return bool(value)
+
+
+def _with_write_concern(coll, write_concern):
+    write_concern = str(write_concern)
+    if write_concern == 'default':
+        return coll
+    w = int(write_concern) if write_concern.isdigit() else write_concern
+    return coll.with_options(write_concern=WriteConcern(w=w))
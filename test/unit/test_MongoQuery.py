@@ -7,6 +7,7 @@ import os
 import time
 import sys
 import json
+from bson.objectid import ObjectId
 
 # Get src directory and put it in path
 # To get import forking for MongoDBLibrary
@@ -102,6 +103,123 @@ class TestMongoDBLibrary(unittest.TestCase):
         expected = ['local']
         self.assertEqual(database_names, expected)
 
+    def test_insert_mongodb_records(self):
+        self.mongo_create_db()
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        inserted_ids = a.insert_mongodb_records(test_database_name, test_collection_name, json.dumps([data2, data3]))
+        a.disconnect_from_mongodb()
+
+        self.assertEqual(len(inserted_ids), 2)
+        self.assertEqual(self._collection.count_documents({}), 2)
+
+    def test_insert_mongodb_records_buffered(self):
+        self.mongo_create_db()
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        a.insert_mongodb_records(test_database_name, test_collection_name, json.dumps([data2]), buffered=True)
+        a.insert_mongodb_records(test_database_name, test_collection_name, json.dumps([data3]), buffered=True)
+        pending = self._collection.count_documents({})
+        count = a.flush_mongodb_writes()
+        a.disconnect_from_mongodb()
+
+        self.assertEqual(pending, 0)
+        self.assertEqual(count, 2)
+        self.assertEqual(self._collection.count_documents({}), 2)
+
+    def test_flush_mongodb_writes_when_a_record_is_rejected(self):
+        self.mongo_create_db()
+        existing_id = self._collection.insert_one(dict(data1)).inserted_id
+        other_collection = self._conn[test_database_name]['other_collection']
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        a.insert_mongodb_records(test_database_name, test_collection_name,
+                                 json.dumps([dict(data2, _id=str(existing_id)), data3]), buffered=True)
+        a.insert_mongodb_records(test_database_name, 'other_collection', json.dumps([data2]), buffered=True)
+        self.assertRaises(Exception, a.flush_mongodb_writes)
+        count = a.flush_mongodb_writes()
+        a.disconnect_from_mongodb()
+
+        self.assertEqual(count, 0)
+        self.assertEqual(self._collection.count_documents({}), 2)
+        self.assertEqual(other_collection.count_documents({}), 1)
+
+    def test_insert_mongodb_records_when_not_an_array(self):
+        self.mongo_create_db()
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        self.assertRaises(Exception, a.insert_mongodb_records, test_database_name, test_collection_name,
+                          json.dumps(data2))
+        a.disconnect_from_mongodb()
+
+        self.assertEqual(self._collection.count_documents({}), 0)
+
+    def test_save_mongodb_records_without_id_inserts(self):
+        self.mongo_create_db()
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        saved_id = a.save_mongodb_records(test_database_name, test_collection_name, json.dumps(data2))
+        a.disconnect_from_mongodb()
+
+        self.assertIsInstance(saved_id, ObjectId)
+        self.assertEqual(self._collection.find_one({'_id': saved_id})['lastName'], 'Wayne')
+
+    def test_save_mongodb_records_with_id_replaces(self):
+        self.mongo_create_db()
+        existing_id = self._collection.insert_one(dict(data2)).inserted_id
+
+        record = dict(data3, _id=str(existing_id))
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        saved_id = a.save_mongodb_records(test_database_name, test_collection_name, json.dumps(record))
+        upserted_id = a.save_mongodb_records(test_database_name, test_collection_name,
+                                             json.dumps(dict(data2, _id='4dacab2d52dfbd26f1000000')))
+        a.disconnect_from_mongodb()
+
+        self.assertIsInstance(saved_id, ObjectId)
+        self.assertEqual(saved_id, existing_id)
+        self.assertEqual(self._collection.find_one({'_id': existing_id}),
+                         dict(data3, _id=existing_id))
+        self.assertEqual(upserted_id, ObjectId('4dacab2d52dfbd26f1000000'))
+        self.assertEqual(self._collection.count_documents({}), 2)
+
+    def test_update_many_mongodb_records_by_id_string(self):
+        self.mongo_create_db()
+        existing_id = self._collection.insert_one(dict(data2)).inserted_id
+        self.mongo_inser_data(data3)
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        modified = a.update_many_mongodb_records(test_database_name, test_collection_name,
+                                                 json.dumps({'_id': str(existing_id)}), '{"$set": {"age": 1}}')
+        a.disconnect_from_mongodb()
+
+        self.assertEqual(modified, 1)
+        self.assertEqual(self._collection.find_one({'_id': existing_id})['age'], 1)
+        self.assertEqual(self._collection.count_documents({'age': 1}), 1)
+
+    def test_bulk_modify_mongodb_records(self):
+        self.mongo_create_db()
+        self.mongo_inser_data(data1)
+        self.mongo_inser_data(data2)
+        self.mongo_inser_data(data3)
+
+        operations = [{"op": "update", "filter": {"firstName": "John"}, "update": {"$set": {"age": 1}}},
+                      {"op": "remove", "filter": {"firstName": "Clark"}}]
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        results = a.bulk_modify_mongodb_records(test_database_name, test_collection_name, json.dumps(operations))
+        a.disconnect_from_mongodb()
+
+        self.assertEqual(results['modified'], 2)
+        self.assertEqual(results['removed'], 1)
+        self.assertEqual(self._collection.count_documents({"age": 1}), 2)
+
     def tearDown(self):
         # Terminate Mongodb process
         if self._process:
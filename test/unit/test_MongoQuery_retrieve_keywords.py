@@ -75,6 +75,30 @@ class TestMongoDBLibrary(unittest.TestCase):
         expected = self.mongo_find_from_collection()
         self.assertEqual(data, expected)
 
+    def test_retrieve_all_mongodb_records_when_streamed(self):
+        self.mongo_create_db()
+        self.mongo_inser_data(data2)
+        self.mongo_inser_data(data3)
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        cursor = a.retrieve_all_mongodb_records(dbName=test_database_name, dbCollName=test_collection_name,
+                                                returnDocuments=True, stream=True)
+        self.assertIsInstance(cursor, pymongo.cursor.Cursor)
+        documents = list(cursor)
+        a.disconnect_from_mongodb()
+
+        self.assertEqual([d['lastName'] for d in documents], ['Wayne', 'Kent'])
+
+    def test_retrieve_all_mongodb_records_when_streamed_without_documents(self):
+        self.mongo_create_db()
+
+        a = MongoDBLibrary()
+        a.connect_to_mongodb(dbHost=test_mongo_connection_host, dbPort=test_mongo_connection_port)
+        self.assertRaises(Exception, a.retrieve_all_mongodb_records, dbName=test_database_name,
+                          dbCollName=test_collection_name, stream=True)
+        a.disconnect_from_mongodb()
+
     def test_retrieve_all_mongodb_records_when_one_document(self):
         self.mongo_create_db()
         self.mongo_inser_data(data2)
@@ -0,0 +1,57 @@
+import unittest
+import os
+import sys
+
+# Get src directory and put it in path
+# To get import forking for MongoDBLibrary
+
+ROOT_DIR = os.path.dirname(os.path.abspath('..'))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+sys.path.insert(0, SRC_DIR)
+
+from MongoDBLibrary.mongoquery import MongoQuery
+
+
+class TestPythonishToJsonDict(unittest.TestCase):
+
+    def test_strict_json(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict('{"a": true, "b": null}'), {'a': True, 'b': None})
+
+    def test_escaped_single_quote(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict(r"{'a': 'it\'s'}"), {'a': "it's"})
+
+    def test_double_quote_inside_single_quotes(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict("{'a': 'x\"y'}"), {'a': 'x"y'})
+
+    def test_single_quotes_inside_double_quotes(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict('{"a": "say \'hi\'"}'), {'a': "say 'hi'"})
+
+    def test_single_quotes_nested_in_single_quotes(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict(r"{'a': 'say \'hi\''}"), {'a': "say 'hi'"})
+
+    def test_escaped_backslash(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict(r"{'a': '\\'}"), {'a': '\\'})
+
+    def test_python_escape_falls_through_to_literal_eval(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict(r"{'a': '\x41'}"), {'a': 'A'})
+
+    def test_mixed_python_and_json_literals(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict("{'a': True, 'b': null, 'c': False}"),
+                         {'a': True, 'b': None, 'c': False})
+
+    def test_escape_only_valid_in_json_is_kept_as_python(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict(r"{'a': '\/'}"), {'a': '\\/'})
+
+    def test_nan_is_accepted(self):
+        value = MongoQuery.pythonish_to_json_dict('{"v": NaN}')['v']
+        self.assertNotEqual(value, value)
+
+    def test_big_integer_stays_integer(self):
+        self.assertEqual(MongoQuery.pythonish_to_json_dict('{"n": 18446744073709551616}'), {'n': 2 ** 64})
+
+    def test_invalid_input(self):
+        self.assertRaises(Exception, MongoQuery.pythonish_to_json_dict, "{'a': ")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import pymongo
+import unittest
+import os
+import sys
+from pymongo.write_concern import WriteConcern
+
+# Get src directory and put it in path
+# To get import forking for MongoDBLibrary
+
+ROOT_DIR = os.path.dirname(os.path.abspath('..'))
+SRC_DIR = os.path.join(ROOT_DIR, "src")
+sys.path.insert(0, SRC_DIR)
+
+from MongoDBLibrary.mongoquery import _with_write_concern
+
+
+class TestWithWriteConcern(unittest.TestCase):
+
+    def setUp(self):
+        # No server is needed, the client only connects on the first operation
+        self._conn = pymongo.MongoClient('localhost', 51000, connect=False)
+        self._collection = self._conn['test_database']['test_collection']
+
+    def tearDown(self):
+        self._conn.close()
+
+    def test_default_keeps_collection(self):
+        self.assertIs(_with_write_concern(self._collection, 'default'), self._collection)
+
+    def test_numeric_string(self):
+        coll = _with_write_concern(self._collection, '0')
+        self.assertEqual(coll.write_concern, WriteConcern(w=0))
+        self.assertFalse(coll.write_concern.acknowledged)
+
+    def test_integer(self):
+        self.assertEqual(_with_write_concern(self._collection, 1).write_concern, WriteConcern(w=1))
+
+    def test_majority(self):
+        self.assertEqual(_with_write_concern(self._collection, 'majority').write_concern, WriteConcern(w='majority'))
+
+    def test_does_not_change_original_collection(self):
+        _with_write_concern(self._collection, '0')
+        self.assertEqual(self._collection.write_concern, WriteConcern())
+
+
+if __name__ == '__main__':
+    unittest.main()